@@ -6,23 +6,107 @@ import os
 import glob
 from pathlib import Path
 from collections import defaultdict
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
+# Prefer google-re2 when available: a linear-time DFA engine that is faster
+# than the stdlib backtracking NFA for the simple patterns fired per line.
+# Fall back to stdlib re so the module works without the C extension.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Prefer orjson's C encoder for the output files; stdlib json stays as the
+# fallback (and for the small console pretty-prints).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Numba kernel for the fallback aggregation in format_quote_groups.
+# The parsers pass running totals, so this only fires for callers handing in
+# bare item groups, and only once a group is large enough to amortize the
+# array conversion.
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _group_totals(costs, qtys):
+        return costs.sum(), qtys.sum()
+except ImportError:
+    np = None
+    _group_totals = None
+
+_NUMBA_MIN_ITEMS = 512
+
+# Precompiled patterns - compiling once at module load avoids re-parsing the
+# pattern (and the re-cache lookup) on every call in the per-line hot loops.
+# Deletion table for currency symbols, whitespace, and thousands separators -
+# str.translate walks the string once in C, far cheaper than a regex sub.
+_PRICE_STRIP_TABLE = str.maketrans('', '', '$€£¥ \t\n\r,')
+# Single alternation covering both price shapes; the decimal branch is tried
+# first at each position so "$1,234.56" matches once, not as "$1,234" + "56".
+_PRICE_RE = _re.compile(r'-?\$?\s*(?:[\d,]+\.\d{2}|[\d,]+)')
+_ITEMCODE_RE = _re.compile(r'^[A-Z0-9-]+(?:\sREV\s[A-Z0-9]+)?(?:\s[A-Z0-9-]+)?\s+')
+_EA_RE = _re.compile(r'(?i)\s*/EA|\s*/EACH')
+# Sematool tokenizer: classifies each token as a decimal price, a standalone
+# integer (quantity / item number), or a description word in one traversal.
+_SEMATOOL_TOK = _re.compile(r'(?P<price>-?\$?[\d,]+\.\d{2})|(?P<int>\b\d+\b)|(?P<word>\S+)')
+_SURROUNDING_QUOTES_RE = re.compile(r'^"|"$')
+_TRAILING_COMMA_RE = re.compile(r',\s*$')
+_TOTAL_DEC_RE = re.compile(r'[\$]?[\d,]+\.\d{2}')
+_TOTAL_INT_RE = re.compile(r'[\$]?[\d,]+')
+# Cheap prefilter for Thirty-Two line items: a matching line must contain a
+# comma followed by a price-ish character. Most lines fail this and never
+# reach the full pattern. re.ASCII keeps \d/\s away from unicode tables.
+_TT_QUICKCHECK = re.compile(r',\s*"?[\-\$\d]', re.ASCII)
+
+# Header/footer lines skipped by the VTN parser. The length gate lets the
+# common case (a real line item) skip the upper() allocation entirely.
+_HEADERS = frozenset({'TOTAL', 'SUBTOTAL', 'MOQ', 'ITEM CODE', 'DESCRIPTION',
+                      'UNIT PRICE', 'AMOUNT', 'QUOTE'})
+_HEADER_MAXLEN = max(map(len, _HEADERS))
+_TT_LINE_ITEM_END_RE = re.compile(
+    r'(\d+)\s*"?,\s*"?([\-]?\$?[\d,]+\.?\d*)"?,\s*"?([\-]?\$?[\d,]+\.?\d*)"?\s*$',
+    re.ASCII
+)
+
+@lru_cache(maxsize=4096)
 def normalize_price(price_str: str) -> str:
     """
     Normalize price string to a consistent decimal format (e.g., "1234.56").
     Handles currency symbols, commas, spaces, and negative values.
-    
+
+    Results are memoized: the same raw tokens ("$0.00", "1.00", ...) recur
+    heavily across a document, so repeat calls become a dict lookup.
+
     REQUIREMENT: Normalize price formats (e.g., $2,000.00 → 2000)
     REQUIREMENT: Handle currency symbols and different decimal formats
     """
     if not price_str:
         return "0.00"
-    
-    # REQUIREMENT: Handle currency symbols - Remove $, €, £, ¥ and spaces
-    cleaned = re.sub(r'[\$€£¥\s]', '', str(price_str))
-    # REQUIREMENT: Handle different decimal formats - Remove thousands separators
-    cleaned = cleaned.replace(',', '')
+
+    raw = str(price_str)
+
+    # Fast path: tokens that are already clean ("1234.56", "$1234.56",
+    # "-$12.00") skip the translate pass and go straight to float().
+    s = raw
+    if s[0] == '$':
+        s = s[1:]
+    elif s[0] == '-' and len(s) > 1 and s[1] == '$':
+        s = '-' + s[2:]
+    if s.replace('-', '', 1).replace('.', '', 1).isdigit():
+        try:
+            return f"{float(s):.2f}"
+        except ValueError:
+            pass
+
+    # REQUIREMENT: Handle currency symbols and different decimal formats -
+    # Remove $, €, £, ¥, spaces, and thousands separators in a single pass
+    cleaned = raw.translate(_PRICE_STRIP_TABLE)
     
     # Check for negative sign
     sign = ''
@@ -36,26 +120,36 @@ def normalize_price(price_str: str) -> str:
     except ValueError:
         return "0.00"
 
-def extract_prices_from_line(line: str) -> List[str]:
+def extract_prices_from_line(line: str) -> List[Tuple[str, int, int]]:
     """
     Extract all price-like patterns from a line, including negative values and
-    various number formats. Returns normalized price strings.
-    
+    various number formats. Returns (normalized_price, start, end) tuples,
+    where start/end are the span of the raw match so callers can slice the
+    line directly instead of re-scanning it.
+
     REQUIREMENT: Extract unit prices and costs from text
     REQUIREMENT: Handle different decimal formats and currency symbols
     """
-    # REQUIREMENT: Handle different variants - Multiple patterns to catch various price formats
-    patterns = [
-        r'-?\$?\s*[\d,]+\.\d{2}',  # e.g., -$1,234.56 or $1,234.56
-        r'-?\$?\s*[\d,]+',         # e.g., -$1,234 or $1,234
-    ]
-    prices = []
-    for pattern in patterns:
-        matches = re.findall(pattern, line)
-        prices.extend(matches)
-    
+    # REQUIREMENT: Handle different variants - Single alternation catches both
+    # decimal and integer price formats in one scan of the line
     # REQUIREMENT: Normalize price formats - Convert all found prices to consistent format
-    return [normalize_price(p) for p in prices if p.strip()]
+    return [(normalize_price(m.group()), m.start(), m.end())
+            for m in _PRICE_RE.finditer(line) if m.group().strip()]
+
+def _leading_qty(line: str) -> Tuple[Optional[str], int]:
+    """
+    Check for a leading quantity ("skip spaces, read digits, require a
+    space") without firing the regex engine. Returns (digits, end_index)
+    where end_index is the position just past the digits in the original
+    line, or (None, 0) if the line does not start with a quantity.
+    """
+    s = line.lstrip()
+    i = 0
+    while i < len(s) and s[i].isdigit():
+        i += 1
+    if i and i < len(s) and s[i].isspace():
+        return s[:i], len(line) - len(s) + i
+    return None, 0
 
 def parse_vtn_format(lines: List[str]) -> List[Dict[str, Any]]:
     """
@@ -67,11 +161,14 @@ def parse_vtn_format(lines: List[str]) -> List[Dict[str, Any]]:
     """
     # REQUIREMENT: Group by quantity - Use defaultdict to automatically group line items
     quote_groups = defaultdict(list)
-    
+    # Running [cost, quantity] totals per group, updated as items are
+    # appended so format_quote_groups need not re-walk the item lists.
+    quote_totals = defaultdict(lambda: [0.0, 0])
+
     for line in lines:
         line = line.strip()
         # REQUIREMENT: Handle inconsistent spacing and casing - strip() and upper() comparison
-        if not line or line.upper() in ['TOTAL', 'SUBTOTAL', 'MOQ', 'ITEM CODE', 'DESCRIPTION', 'UNIT PRICE', 'AMOUNT', 'QUOTE']:
+        if not line or (len(line) <= _HEADER_MAXLEN and line.upper() in _HEADERS):
             continue
 
         # REQUIREMENT: Extract unit prices and costs
@@ -82,40 +179,26 @@ def parse_vtn_format(lines: List[str]) -> List[Dict[str, Any]]:
         
         try:
             # REQUIREMENT: Extract costs and unit prices from rightmost price values
-            cost = line_prices[-1]
-            unit_price = line_prices[-2]
+            cost = line_prices[-1][0]
+            unit_price = line_prices[-2][0]
 
             # REQUIREMENT: Extract quantities - Look for quantity at beginning of line
-            qty_match = re.match(r'^\s*(\d+)\s+', line)
+            qty_candidate, qty_end = _leading_qty(line)
             quantity = "1"
-            if qty_match:
-                qty_candidate = qty_match.group(1)
+            if qty_candidate is not None:
                 # Heuristic: Quantity is usually not excessively large
-                if int(qty_candidate) <= 10000: 
+                if int(qty_candidate) <= 10000:
                     quantity = qty_candidate
             else:
                 continue
 
-            # REQUIREMENT: Extract descriptions - Remove quantity and prices to get description
-            temp_line = line
-            if qty_match:
-                temp_line = temp_line[qty_match.end():].strip()
-            
-            # Remove price values from the line to get description
-            for p_val in reversed(line_prices):
-                raw_prices_in_line = re.findall(r'-?\$?[\d,]+\.?\d*', temp_line)
-                if raw_prices_in_line:
-                    if normalize_price(raw_prices_in_line[-1]) == p_val:
-                        # rsplit ensures we remove from the right side
-                        temp_line = re.rsplit(re.escape(raw_prices_in_line[-1]), temp_line, 1)[0].strip()
-                    elif len(raw_prices_in_line) >= 2 and normalize_price(raw_prices_in_line[-2]) == p_val:
-                        temp_line = re.rsplit(re.escape(raw_prices_in_line[-2]), temp_line, 1)[0].strip()
-
-            description = temp_line.strip()
-            
+            # REQUIREMENT: Extract descriptions - The description is the text
+            # between the quantity and the unit-price span; the spans from the
+            # price scan make re-scanning the line unnecessary.
+            description = line[qty_end:line_prices[-2][1]].strip()
+
             # REQUIREMENT: Handle inconsistent formatting - Remove common item code patterns
-            item_code_pattern = r'^[A-Z0-9-]+(?:\sREV\s[A-Z0-9]+)?(?:\s[A-Z0-9-]+)?\s+'
-            description = re.sub(item_code_pattern, '', description).strip()
+            description = _ITEMCODE_RE.sub('', description).strip()
 
             if description and quantity != "0" and unit_price != "0.00" and cost != "0.00":
                 # REQUIREMENT: Extract all required fields into structured format
@@ -125,13 +208,18 @@ def parse_vtn_format(lines: List[str]) -> List[Dict[str, Any]]:
                     "unitPrice": unit_price,
                     "cost": cost
                 }
-                # REQUIREMENT: Group by quantity - Group line items by their quantity
-                quote_groups[quantity].append(item)
+                # REQUIREMENT: Group by quantity - Group line items by their
+                # quantity, keyed as int so sorting needs no per-key conversion
+                qty_int = int(quantity)
+                quote_groups[qty_int].append(item)
+                totals = quote_totals[qty_int]
+                totals[0] += float(cost)
+                totals[1] += qty_int
         except Exception as e:
             continue
-            
+
     # REQUIREMENT: Each group must reflect its own price breakdown
-    return format_quote_groups(quote_groups)
+    return format_quote_groups(quote_groups, quote_totals)
 
 def parse_sematool_format(lines: List[str]) -> List[Dict[str, Any]]:
     """
@@ -141,6 +229,8 @@ def parse_sematool_format(lines: List[str]) -> List[Dict[str, Any]]:
     REQUIREMENT: Handle different variants of Quotes - Sematool tabular format
     """
     items = []
+    total_qty = 0
+    total_cost = 0.0
     in_table = False
     header_line_index = -1
     
@@ -162,54 +252,42 @@ def parse_sematool_format(lines: List[str]) -> List[Dict[str, Any]]:
         if 'total:' in line.lower():
             break
 
+        # One tokenizer pass classifies every token; the old code instead
+        # walked the line repeatedly (price removal, quantity removal,
+        # item-number removal) with a re.sub stage for each.
+        prices = []
+        last_int = None
+        desc_words = []
+        for tok in _SEMATOOL_TOK.finditer(line):
+            price = tok.group('price')
+            if price is not None:
+                prices.append(normalize_price(price))
+                continue
+            num = tok.group('int')
+            if num is not None:
+                last_int = num
+                continue
+            desc_words.append(tok.group('word'))
+
         # REQUIREMENT: Extract unit prices and costs
-        line_prices = extract_prices_from_line(line)
-        if len(line_prices) < 2:
+        if len(prices) < 2:
             continue
 
         try:
-            cost = line_prices[-1]
-            unit_price = line_prices[-2]
+            cost = prices[-1]
+            unit_price = prices[-2]
 
-            # REQUIREMENT: Extract quantities - Find quantity from non-price numbers
+            # REQUIREMENT: Extract quantities - The last standalone integer;
+            # prices and the leading item number are other token kinds
             quantity = "1"
-            all_numbers_in_line = re.findall(r'\b\d+\b', line)
-            
-            # Remove numbers that are part of prices to isolate potential quantities
-            temp_line_for_qty = line
-            for p_val in line_prices:
-                raw_price_match = re.search(re.escape(p_val.replace('.00', '')), temp_line_for_qty)
-                if raw_price_match:
-                    temp_line_for_qty = temp_line_for_qty[:raw_price_match.start()] + temp_line_for_qty[raw_price_match.end():]
-            
-            potential_quantities = re.findall(r'\b(\d+)\b', temp_line_for_qty)
-            if potential_quantities:
-                qty_candidate = potential_quantities[-1]
-                if int(qty_candidate) <= 10000:
-                    quantity = qty_candidate
-            
-            # REQUIREMENT: Extract descriptions - Remove prices, quantities, and item numbers
-            temp_line = line
-            
-            # Remove prices from the line
-            for p_val in line_prices: # Iterate over normalized prices
-                # Find the raw price string in the line that corresponds to the normalized price
-                # This is a bit tricky as normalize_price changes the string.
-                # A more robust way would be to identify the span of the raw price and remove it.
-                # For now, we'll try to remove the normalized value from the temp_line.
-                # This might not be perfect if the normalized price appears elsewhere in description.
-                temp_line = re.sub(re.escape(p_val.replace('.00', '')), '', temp_line, flags=re.IGNORECASE, count=1)
-
+            if last_int is not None and int(last_int) <= 10000:
+                quantity = last_int
 
-            # Remove quantity if it was found
-            temp_line = re.sub(r'\b' + re.escape(quantity) + r'\b', '', temp_line, 1)
-
-            # Remove leading item number
-            temp_line = re.sub(r'^\s*\d+\s*', '', temp_line, 1)
-
-            description = temp_line.strip()
+            # REQUIREMENT: Extract descriptions - Only WORD tokens remain;
+            # prices, quantity, and item number never enter the buffer
+            description = ' '.join(desc_words).strip()
             # REQUIREMENT: Handle inconsistent formatting - Remove unit indicators
-            description = re.sub(r'\s*/EA|\s*/EACH', '', description, flags=re.IGNORECASE).strip()
+            description = _EA_RE.sub('', description).strip()
 
             if description and quantity != "0" and unit_price != "0.00" and cost != "0.00":
                 # REQUIREMENT: Extract all required fields into structured format
@@ -220,14 +298,14 @@ def parse_sematool_format(lines: List[str]) -> List[Dict[str, Any]]:
                     "cost": cost
                 }
                 items.append(item)
+                total_qty += int(quantity)
+                total_cost += float(cost)
         except Exception as e:
             continue
-    
+
     if items:
         # REQUIREMENT: Group by quantity - Aggregate all items into single quote group
         # REQUIREMENT: Each group must reflect its own price breakdown
-        total_qty = sum(int(item['quantity']) for item in items)
-        total_cost = sum(float(item['cost']) for item in items)
         avg_unit_price = total_cost / total_qty if total_qty > 0 else 0.0
         
         return [{
@@ -247,6 +325,8 @@ def parse_thirtytwo_machine_format(lines: List[str]) -> List[Dict[str, Any]]:
     REQUIREMENT: Handle different variants of Quotes - Thirty-Two Machine multi-line format
     """
     quote_groups = defaultdict(list)
+    total_qty = 0
+    total_cost = 0.0
     current_item_description_lines = []
     
     header_line_index = -1
@@ -259,23 +339,18 @@ def parse_thirtytwo_machine_format(lines: List[str]) -> List[Dict[str, Any]]:
     if header_line_index == -1:
         return []
 
-    # REQUIREMENT: Handle inconsistent spacing and special characters - robust regex pattern
-    line_item_end_pattern = re.compile(
-        r'(\d+)\s*"?,\s*"?([\-]?\$?[\d,]+\.?\d*)"?,\s*"?([\-]?\$?[\d,]+\.?\d*)"?\s*$'
-    )
-    
     for i in range(header_line_index + 1, len(lines)):
         line = lines[i].strip()
         if not line:
             continue
         
         # REQUIREMENT: Handle inconsistent casing - case-insensitive total detection
-        if 'total' in line.lower() and (re.search(r'[\$]?[\d,]+\.\d{2}', line) or re.search(r'[\$]?[\d,]+', line)):
+        if 'total' in line.lower() and (_TOTAL_DEC_RE.search(line) or _TOTAL_INT_RE.search(line)):
             if current_item_description_lines:
                 current_item_description_lines = []
             break
 
-        match = line_item_end_pattern.search(line)
+        match = _TT_LINE_ITEM_END_RE.search(line) if _TT_QUICKCHECK.search(line) else None
         
         if match:
             quantity_raw, unit_price_raw, cost_raw = match.groups()
@@ -294,8 +369,8 @@ def parse_thirtytwo_machine_format(lines: List[str]) -> List[Dict[str, Any]]:
             description = ' '.join(current_item_description_lines).strip()
             
             # REQUIREMENT: Handle special characters - Remove quotes and trailing commas
-            description = re.sub(r'^"|"$', '', description).strip()
-            description = re.sub(r',\s*$', '', description).strip()
+            description = _SURROUNDING_QUOTES_RE.sub('', description).strip()
+            description = _TRAILING_COMMA_RE.sub('', description).strip()
             
             if description and quantity != "0" and unit_price != "0.00" and cost != "0.00":
                 # REQUIREMENT: Extract all required fields into structured format
@@ -305,8 +380,10 @@ def parse_thirtytwo_machine_format(lines: List[str]) -> List[Dict[str, Any]]:
                     "unitPrice": unit_price,
                     "cost": cost
                 }
-                quote_groups[quantity].append(item)
-            
+                quote_groups[int(quantity)].append(item)
+                total_qty += int(quantity)
+                total_cost += float(cost)
+
             current_item_description_lines = []
         else:
             # This line is likely a continuation of the description
@@ -319,8 +396,6 @@ def parse_thirtytwo_machine_format(lines: List[str]) -> List[Dict[str, Any]]:
         all_items.extend(qty_group_items)
 
     if all_items:
-        total_qty = sum(int(item['quantity']) for item in all_items)
-        total_cost = sum(float(item['cost']) for item in all_items)
         avg_unit_price = total_cost / total_qty if total_qty > 0 else 0.0
         
         return [{
@@ -332,25 +407,40 @@ def parse_thirtytwo_machine_format(lines: List[str]) -> List[Dict[str, Any]]:
     
     return []
 
-def format_quote_groups(quote_groups: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
+def format_quote_groups(quote_groups: Dict[int, List[Dict]],
+                        quote_totals: Optional[Dict[int, List]] = None) -> List[Dict[str, Any]]:
     """
     Formats the grouped line items into the final structured JSON output.
     Calculates total quantity, total price, and average unit price for each group.
-    
+
+    quote_totals maps each group key to its running [cost, quantity] totals,
+    maintained while the items were appended; when omitted, the totals are
+    recomputed by summing the items.
+
     REQUIREMENT: Each group must reflect its own price breakdown
     REQUIREMENT: Group separate quote options by total quantity
     """
     structured_quotes = []
-    
-    # Sort groups by quantity for consistent output order
-    sorted_quantities = sorted(quote_groups.keys(), key=lambda x: int(x))
+
+    # Sort groups by quantity for consistent output order; keys are already
+    # ints, so this is a native integer sort with no per-key conversion
+    sorted_quantities = sorted(quote_groups)
 
     for qty in sorted_quantities:
         items = quote_groups[qty]
         # REQUIREMENT: Each group must reflect its own price breakdown - Calculate totals per group
-        total_cost_for_group = sum(float(item['cost']) for item in items)
-        total_qty_for_group = sum(int(item['quantity']) for item in items)
-        
+        if quote_totals is not None:
+            total_cost_for_group, total_qty_for_group = quote_totals[qty]
+        elif _group_totals is not None and len(items) >= _NUMBA_MIN_ITEMS:
+            costs = np.fromiter((float(item['cost']) for item in items),
+                                dtype=np.float64, count=len(items))
+            qtys = np.fromiter((int(item['quantity']) for item in items),
+                               dtype=np.int64, count=len(items))
+            total_cost_for_group, total_qty_for_group = _group_totals(costs, qtys)
+        else:
+            total_cost_for_group = sum(float(item['cost']) for item in items)
+            total_qty_for_group = sum(int(item['quantity']) for item in items)
+
         avg_unit_price_for_group = total_cost_for_group / total_qty_for_group if total_qty_for_group > 0 else 0.0
         
         # REQUIREMENT: Group separate quote options by total quantity - Create separate group objects
@@ -363,6 +453,49 @@ def format_quote_groups(quote_groups: Dict[str, List[Dict]]) -> List[Dict[str, A
             
     return structured_quotes
 
+# Format dispatch table: (signatures, parser, label). Detection scans for the
+# signatures, and the same table drives the generic fallback, tried in order
+# of complexity - no duplicated signature logic between the two paths.
+_FORMATS = [
+    (('VTN MANUFACTURING',), parse_vtn_format, 'VTN Manufacturing'),
+    (('SEMATOOL',), parse_sematool_format, 'Sematool tabular'),
+    (('THIRTY-TWO MACHINE', '32 MACHINE+DESIGN'), parse_thirtytwo_machine_format,
+     'Thirty-Two Machine'),
+]
+_FORMAT_SIGNATURES = tuple(sig for sigs, _, _ in _FORMATS for sig in sigs)
+
+# With pyahocorasick installed, one automaton matches every signature in a
+# single scan per line; otherwise plain substring tests are the fallback.
+try:
+    import ahocorasick
+    _SIGNATURE_AUTOMATON = ahocorasick.Automaton()
+    for _sig in _FORMAT_SIGNATURES:
+        _SIGNATURE_AUTOMATON.add_word(_sig, _sig)
+    _SIGNATURE_AUTOMATON.make_automaton()
+except ImportError:
+    _SIGNATURE_AUTOMATON = None
+
+def _detect_signature(lines: List[str]) -> Optional[str]:
+    """
+    Return the first format signature found in the document, or None.
+    Scans line by line (uppercasing each line as it goes) so the whole
+    document is never joined and copied; with pyahocorasick available all
+    signatures are matched in a single pass per line.
+
+    REQUIREMENT: Handle inconsistent casing - Convert to uppercase for comparison
+    """
+    if _SIGNATURE_AUTOMATON is not None:
+        for line in lines:
+            for _, signature in _SIGNATURE_AUTOMATON.iter(line.upper()):
+                return signature
+    else:
+        for line in lines:
+            upper = line.upper()
+            for signature in _FORMAT_SIGNATURES:
+                if signature in upper:
+                    return signature
+    return None
+
 def detect_format_and_parse(lines: List[str]) -> List[Dict[str, Any]]:
     """
     Detects the quote format based on keywords in the PDF text
@@ -370,28 +503,26 @@ def detect_format_and_parse(lines: List[str]) -> List[Dict[str, Any]]:
     
     REQUIREMENT: Handle different variants of Quotes - Multiple format detection and parsing
     """
-    # REQUIREMENT: Handle inconsistent casing - Convert to uppercase for comparison
-    text_content = ' '.join(lines).upper()
-    
-    # REQUIREMENT: Handle different variants - Format detection order: most specific to most generic
-    if 'VTN MANUFACTURING' in text_content:
-        print("Detected VTN Manufacturing format.")
-        return parse_vtn_format(lines)
-    elif 'SEMATOOL' in text_content:
-        print("Detected Sematool tabular format.")
-        return parse_sematool_format(lines)
-    elif 'THIRTY-TWO MACHINE' in text_content or '32 MACHINE+DESIGN' in text_content:
-        print("Detected Thirty-Two Machine format.")
-        return parse_thirtytwo_machine_format(lines)
-    else:
-        print("No specific format detected. Attempting generic parsing strategies.")
-        # REQUIREMENT: Handle different variants - Try parsers in order of complexity as fallback
-        result = parse_vtn_format(lines)
-        if not result:
-            result = parse_sematool_format(lines)
-        if not result:
-            result = parse_thirtytwo_machine_format(lines)
-        return result
+    signature = _detect_signature(lines)
+
+    # REQUIREMENT: Handle different variants - Dispatch on the detected signature
+    if signature is not None:
+        for signatures, parser_fn, label in _FORMATS:
+            if signature in signatures:
+                print(f"Detected {label} format.")
+                return parser_fn(lines)
+
+    print("No specific format detected. Attempting generic parsing strategies.")
+    # REQUIREMENT: Handle different variants - Try parsers in order of complexity as fallback
+    for _, parser_fn, _ in _FORMATS:
+        result = parser_fn(lines)
+        if result:
+            return result
+    return []
+
+# Plain-text extraction flags: ligature preservation and dehyphenation are
+# unicode post-processing passes the parsers never benefit from.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES & ~fitz.TEXT_DEHYPHENATE
 
 def extract_text_from_pdf(pdf_path: str) -> Tuple[List[str], bool]:
     """
@@ -399,12 +530,13 @@ def extract_text_from_pdf(pdf_path: str) -> Tuple[List[str], bool]:
     Returns a tuple of (lines, success_flag).
     """
     try:
-        doc = fitz.open(pdf_path)
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text()
-        doc.close()
-        
+        # "text" mode skips layout/blocks analysis; list-append + join keeps
+        # accumulation O(n) instead of quadratic string concatenation, and the
+        # context manager closes the document even if a page read raises.
+        with fitz.open(pdf_path) as doc:
+            parts = [page.get_text("text", flags=_TEXT_FLAGS) for page in doc]
+        full_text = "".join(parts)
+
         lines = full_text.split("\n")
         return lines, True
     except Exception as e:
@@ -454,6 +586,21 @@ def process_single_pdf(pdf_path: str, verbose: bool = True) -> Dict[str, Any]:
     
     return result
 
+def _json_dumps_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode()
+
+def process_single_pdf_worker(pdf_path: str) -> Dict[str, Any]:
+    """
+    Top-level wrapper around process_single_pdf so it can be pickled and
+    dispatched to a process pool. Workers stay quiet; the parent reports.
+    """
+    return process_single_pdf(pdf_path, verbose=False)
+
 def find_pdf_files(paths: List[str]) -> List[str]:
     """
     Expand paths to find all PDF files.
@@ -465,9 +612,12 @@ def find_pdf_files(paths: List[str]) -> List[str]:
         if os.path.isfile(path) and path.lower().endswith('.pdf'):
             pdf_files.append(path)
         elif os.path.isdir(path):
-            dir_pdfs = glob.glob(os.path.join(path, "*.pdf"))
-            dir_pdfs.extend(glob.glob(os.path.join(path, "*.PDF")))
-            pdf_files.extend(dir_pdfs)
+            # One scandir pass covers both .pdf and .PDF; the DirEntry caches
+            # the stat result, so no extra syscall per entry.
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                        pdf_files.append(entry.path)
         else:
             glob_matches = glob.glob(path)
             pdf_matches = [f for f in glob_matches if f.lower().endswith('.pdf')]
@@ -493,8 +643,10 @@ Examples:
     parser.add_argument("--out", help="Output JSON file path", default="parsed_quotes.json")
     parser.add_argument("--pretty", action="store_true", help="Pretty print JSON output")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress output")
-    parser.add_argument("--separate-files", action="store_true", 
+    parser.add_argument("--separate-files", action="store_true",
                         help="Create separate JSON files for each PDF instead of one combined file")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="Number of worker processes for parsing PDFs (default: CPU count)")
     
     args = parser.parse_args()
     
@@ -513,59 +665,75 @@ Examples:
             print(f"    Files: {[os.path.basename(f) for f in pdf_files]}")
         print()
     
-    all_results = []
-    successful_parses = 0
-    
-    for pdf_file in pdf_files:
-        result = process_single_pdf(pdf_file, verbose=not args.quiet)
-        all_results.append(result)
+    def iter_results():
+        # Yield per-PDF results one at a time as they complete so the full
+        # result set is never held in memory at once.
+        if args.jobs and args.jobs > 1 and len(pdf_files) > 1:
+            # Each PDF is independent, so parse them across processes. This
+            # also sidesteps the GIL for the Python-side parsing work.
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                futures = [executor.submit(process_single_pdf_worker, pdf)
+                           for pdf in pdf_files]
+                for future in as_completed(futures):
+                    yield future.result()
+        else:
+            for pdf_file in pdf_files:
+                yield process_single_pdf(pdf_file, verbose=False)
+
+    def report(result):
+        # Per-result console output, emitted as each result streams in.
+        if args.quiet:
+            return
+        print(f"Processing: {result['file']}")
         if result["success"]:
-            successful_parses += 1
-    
+            print(f"   Success: Extracted {len(result['quotes'])} quote group(s)")
+            print(json.dumps(result["quotes"], indent=2))
+        else:
+            print(f"   Error: {result['error']}")
+
+    successful_parses = 0
+
     if args.separate_files:
-        for result in all_results:
+        for result in iter_results():
+            report(result)
             if result["success"]:
+                successful_parses += 1
                 base_name = Path(result["file"]).stem
                 output_file = f"{base_name}_parsed.json"
-                
-                json_output = json.dumps(result["quotes"], indent=2 if args.pretty else None)
-                with open(output_file, "w") as f:
-                    f.write(json_output)
-                
+
+                with open(output_file, "wb") as f:
+                    f.write(_json_dumps_bytes(result["quotes"], args.pretty))
+
                 if not args.quiet:
                     print(f"Saved: {output_file}")
     else:
-        output_data = {
-            "summary": {
+        # Stream each result into the combined file as it completes instead
+        # of building one giant dict; the summary is written last because
+        # its counters are only known once the stream ends.
+        with open(args.out, "wb") as f:
+            f.write(b'{"results": [')
+            first = True
+            for result in iter_results():
+                report(result)
+                if result["success"]:
+                    successful_parses += 1
+                if not first:
+                    f.write(b",")
+                f.write(_json_dumps_bytes(result, args.pretty))
+                first = False
+            summary = {
                 "total_files": len(pdf_files),
                 "successful_parses": successful_parses,
                 "failed_parses": len(pdf_files) - successful_parses
-            },
-            "results": all_results
-        }
-        
-        json_output = json.dumps(output_data, indent=2 if args.pretty else None)
-        
-        with open(args.out, "w") as f:
-            f.write(json_output)
-        
+            }
+            f.write(b'], "summary": ' + _json_dumps_bytes(summary, args.pretty) + b'}')
+
         if not args.quiet:
             print(f"Summary:")
             print(f"    Total files processed: {len(pdf_files)}")
             print(f"    Successful parses: {successful_parses}")
             print(f"    Failed parses: {len(pdf_files) - successful_parses}")
             print(f"Results saved to: {args.out}")
-    
-    if not args.quiet:
-        print("Parsed Quote Data:")
-        print("=" * 50)
-        
-        for result in all_results:
-            if result["success"]:
-                print(f" {os.path.basename(result['file'])}:")
-                print(json.dumps(result["quotes"], indent=2))
-            else:
-                print(f" Error: {os.path.basename(result['file'])}: {result['error']}")
 
 if __name__ == "__main__":
     main()